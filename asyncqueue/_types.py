@@ -2,3 +2,4 @@ from typing import ParamSpec, TypeVar
 
 P = ParamSpec("P")
 TResult = TypeVar("TResult")
+T = TypeVar("T")
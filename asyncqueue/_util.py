@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
+import uuid
 from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
@@ -13,6 +17,57 @@ def utc_now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+_UUID7_MAX_COUNTER = 0xFFF
+_UUID7_RANDOM_BYTES = 10
+_UUID7_POOL_SIZE = _UUID7_RANDOM_BYTES * 256
+_uuid7_lock = threading.Lock()
+_uuid7_last_timestamp_ms = 0
+_uuid7_counter = 0
+_uuid7_pool = b""
+_uuid7_pool_offset = _UUID7_POOL_SIZE
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562).
+
+    rand_a holds a 12-bit counter (method 1) so ids generated by this process
+    within the same millisecond are ordered too. Random bits are taken from
+    a pooled os.urandom buffer, the state is guarded by a lock.
+    """
+    global _uuid7_last_timestamp_ms, _uuid7_counter, _uuid7_pool, _uuid7_pool_offset
+
+    with _uuid7_lock:
+        offset = _uuid7_pool_offset
+        if offset == _UUID7_POOL_SIZE:
+            _uuid7_pool, offset = os.urandom(_UUID7_POOL_SIZE), 0
+        rand = int.from_bytes(_uuid7_pool[offset : offset + _UUID7_RANDOM_BYTES], "big")
+
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _uuid7_last_timestamp_ms:
+            # Top 11 random bits, the counter's top bit is left clear for room to grow
+            counter = rand >> 69
+        else:
+            timestamp_ms = _uuid7_last_timestamp_ms
+            counter = _uuid7_counter + 1
+            if counter > _UUID7_MAX_COUNTER:
+                timestamp_ms += 1
+                counter = 0
+        _uuid7_last_timestamp_ms, _uuid7_counter, _uuid7_pool_offset = (
+            timestamp_ms,
+            counter,
+            offset + _UUID7_RANDOM_BYTES,
+        )
+
+    return uuid.UUID(
+        int=(timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | counter << 64
+        | 0b10 << 62  # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b, low 62 random bits
+    )
+
+
 def extract_tasks(
     tasks: TaskRouter | Sequence[TaskDefinition[Any, Any]],
 ) -> Sequence[TaskDefinition[Any, Any]]:
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import Sequence
 from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 from typing import Protocol
@@ -21,7 +21,7 @@ class Broker(Protocol):
         exc_tb: TracebackType | None,
     ) -> None: ...
 
-    def listen(self) -> AsyncIterator[TaskRecord]: ...
+    async def read(self, count: int) -> Sequence[TaskRecord]: ...
 
     def ack_context(self, task: TaskRecord) -> AbstractAsyncContextManager[None]: ...
 
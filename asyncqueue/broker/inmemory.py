@@ -1,6 +1,6 @@
 import asyncio
 import contextlib
-from collections.abc import AsyncIterator
+from collections.abc import Sequence
 from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 
@@ -31,8 +31,13 @@ class InMemoryBroker(Broker):
     async def enqueue(self, task: TaskRecord) -> None:
         await self._send.send(task)
 
-    def listen(self) -> AsyncIterator[TaskRecord]:
-        return self._recv
+    async def read(self, count: int) -> Sequence[TaskRecord]:
+        tasks = [await self._recv.receive()]
+        buffered = self._recv.statistics().current_buffer_used
+        tasks.extend(
+            self._recv.receive_nowait() for _ in range(min(count - 1, buffered))
+        )
+        return tasks
 
     def ack_context(
         self,
@@ -1,17 +1,20 @@
 import asyncio
+import collections
 import contextlib
 import dataclasses
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from datetime import timedelta
 from types import TracebackType
 from typing import TYPE_CHECKING, Annotated
 
 import anyio
-import msgspec.json
+import msgspec
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 from typing_extensions import Doc, Self
 
+from asyncqueue._types import T
 from asyncqueue.broker.abc import Broker
 from asyncqueue.serialization import TaskRecord
 
@@ -20,6 +23,21 @@ if TYPE_CHECKING:
 else:
     RedisClient = Redis
 
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(TaskRecord)
+
+
+def _fail_unsent(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_exception(
+            RuntimeError("Broker was closed before the task was sent to redis")
+        )
+
+
+def _drain_queue(queue: asyncio.Queue[T], batch: list[T], max_size: int) -> None:
+    while len(batch) < max_size and not queue.empty():
+        batch.append(queue.get_nowait())
+
 
 @dataclasses.dataclass(kw_only=True, slots=True)
 class RedisBrokerConfig:
@@ -34,8 +52,29 @@ class RedisBrokerConfig:
     xread_block_time: timedelta = timedelta(seconds=1)
     xread_count: Annotated[
         int,
-        Doc("Amount of entries to receive from stream at once"),
-    ] = 1
+        Doc(
+            "Maximum amount of entries to receive from stream at once, "
+            "reads are also limited by the amount of free worker slots"
+        ),
+    ] = 64
+    enqueue_max_delay: Annotated[
+        timedelta,
+        Doc(
+            "How long enqueued tasks are buffered before being sent to redis in a single pipeline"
+        ),
+    ] = timedelta(milliseconds=1)
+    enqueue_max_batch: Annotated[
+        int,
+        Doc("Maximum amount of tasks sent to redis in a single pipeline"),
+    ] = 1000
+    ack_max_delay: Annotated[
+        timedelta,
+        Doc("How long ACKs of processed tasks are buffered before being sent to redis"),
+    ] = timedelta(milliseconds=5)
+    ack_max_batch: Annotated[
+        int,
+        Doc("Maximum amount of tasks ACKed with a single XACK command"),
+    ] = 500
     reclaim_time: timedelta = timedelta(seconds=5)
     requeue_interval: Annotated[
         timedelta,
@@ -52,50 +91,85 @@ class RedisBroker(Broker):
         redis: RedisClient,
         config: RedisBrokerConfig | None = None,
         consumer_name: str,
-        max_concurrency: int = 20,
     ) -> None:
         self._redis = redis
         self._config = config or RedisBrokerConfig()
         self._consumer_name = consumer_name
+        self._xread_streams = {self._config.stream_name: ">"}
+        self._xread_block_ms = int(self._config.xread_block_time.total_seconds() * 1000)
         self._task_ids: dict[str, bytes] = {}
-        self._sem = asyncio.Semaphore(max_concurrency)
+        self._has_active_tasks = asyncio.Event()
+        self._ack_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._batch_acks = False
+        self._enqueue_buffer: collections.deque[tuple[bytes, asyncio.Future[None]]] = (
+            collections.deque()
+        )
+        self._enqueue_flusher: asyncio.Task[None] | None = None
 
         self._is_initialized = False
 
     async def enqueue(self, task: TaskRecord) -> None:
-        async with self._sem:
-            await self._redis.xadd(
-                self._config.stream_name,
-                {"value": msgspec.json.encode(task)},
-            )
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._enqueue_buffer.append((_encoder.encode(task), future))
+        flusher = self._enqueue_flusher
+        if flusher is None or flusher.done() or flusher.get_loop() is not loop:
+            self._enqueue_flusher = loop.create_task(self._enqueue_flusher_worker())
+        await future
+
+    async def _enqueue_flusher_worker(self) -> None:
+        """Send buffered tasks to redis, one pipeline per batch, until the buffer is empty."""
+        max_batch = self._config.enqueue_max_batch
+        buffer = self._enqueue_buffer
+        while buffer:
+            if len(buffer) < max_batch:
+                await asyncio.sleep(self._config.enqueue_max_delay.total_seconds())
+            batch = [buffer.popleft() for _ in range(min(len(buffer), max_batch))]
+            # Tasks whose enqueue() was cancelled are not sent
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for value, _ in batch:
+                    pipe.xadd(self._config.stream_name, {"value": value})
+                try:
+                    results = await pipe.execute(raise_on_error=False)
+                except Exception as e:  # noqa: BLE001
+                    results = [e] * len(batch)
+
+                for (_, future), result in zip(batch, results, strict=True):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(None)
+            finally:
+                for _, future in batch:
+                    _fail_unsent(future)
 
     async def __aenter__(self) -> Self:
-        if self._is_initialized:
-            return self
-
-        stream_exists = await self._redis.exists(self._config.stream_name) != 0
-        group_exists = (
-            self._config.group_name
-            in (
-                info["name"].decode()
-                for info in await self._redis.xinfo_groups(self._config.stream_name)  # type: ignore[no-untyped-call]
-            )
-            if stream_exists
-            else False
-        )
-        if not stream_exists or not group_exists:
+        if not self._is_initialized:
+            await self._create_group()
+            self._is_initialized = True
+        return self
+
+    async def _create_group(self) -> None:
+        try:
             await self._redis.xgroup_create(
                 self._config.stream_name,
                 self._config.group_name,
                 mkstream=True,
             )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
         await self._redis.xgroup_createconsumer(  # type: ignore[no-untyped-call]
             self._config.stream_name,
             self._config.group_name,
             self._consumer_name,
         )
-        self._is_initialized = True
-        return self
 
     async def __aexit__(
         self,
@@ -103,28 +177,43 @@ class RedisBroker(Broker):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        pass
+        await self._flush_acks()
 
-    async def listen(self) -> AsyncIterator[TaskRecord]:
-        while True:
-            xread = await self._redis.xreadgroup(
-                self._config.group_name,
-                self._consumer_name,
-                {self._config.stream_name: ">"},
-                count=self._config.xread_count,
-                block=int(self._config.xread_block_time.total_seconds() * 1000),
-            )
-            for _, records in xread:
-                for record_id, record in records:
-                    task = msgspec.json.decode(record[b"value"], type=TaskRecord)
-                    self._task_ids[task.id] = record_id
-                    logging.debug(task)
-                    yield task
+        flusher = self._enqueue_flusher
+        if (
+            flusher is not None
+            and not flusher.done()
+            and flusher.get_loop() is asyncio.get_running_loop()
+        ):
+            # The flusher exits on its own once every buffered task is sent
+            await asyncio.shield(flusher)
+
+    async def read(self, count: int) -> Sequence[TaskRecord]:
+        xread = await self._redis.xreadgroup(
+            self._config.group_name,
+            self._consumer_name,
+            self._xread_streams,
+            count=min(count, self._config.xread_count),
+            block=self._xread_block_ms,
+        )
+        decode = _decoder.decode
+        task_ids = self._task_ids
+        tasks = []
+        for _, records in xread:
+            for record_id, record in records:
+                task = decode(record[b"value"])
+                logging.debug(task)
+                task_ids[task.id] = record_id
+                tasks.append(task)
+        if tasks:
+            self._has_active_tasks.set()
+        return tasks
 
     async def run_worker_maintenance_tasks(self, stop: asyncio.Event) -> None:
         async with anyio.create_task_group() as tg:
             tg.start_soon(self._maintenance_claim_running_tasks_worker, stop)
             tg.start_soon(self._maintenance_claim_pending_records, stop)
+            tg.start_soon(self._maintenance_ack_flusher, stop)
 
     async def _maintenance_claim_running_tasks_worker(
         self, stop: asyncio.Event
@@ -132,14 +221,13 @@ class RedisBroker(Broker):
         """Reclaims owned messages so they don't get collected by other workers."""
         closes = asyncio.create_task(stop.wait())
         while True:
-            if self._task_ids:
-                await self._redis.xclaim(  # type: ignore[no-untyped-call]
-                    self._config.stream_name,
-                    self._config.group_name,
-                    self._consumer_name,
-                    min_idle_time=0,
-                    message_ids=tuple(self._task_ids.values()),
-                )
+            has_active_tasks = asyncio.create_task(self._has_active_tasks.wait())
+            await asyncio.wait(
+                {closes, has_active_tasks}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if stop.is_set():
+                has_active_tasks.cancel()
+                return
 
             sleep_task = asyncio.create_task(
                 asyncio.sleep(self._config.reclaim_time.total_seconds())
@@ -148,8 +236,23 @@ class RedisBroker(Broker):
                 {closes, sleep_task}, return_when=asyncio.FIRST_COMPLETED
             )
             if stop.is_set():
+                sleep_task.cancel()
                 return
 
+            if self._task_ids:
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.xclaim(
+                    self._config.stream_name,
+                    self._config.group_name,
+                    self._consumer_name,
+                    min_idle_time=0,
+                    message_ids=list(self._task_ids.values()),
+                    justid=True,
+                )
+                pipe.xlen(self._config.stream_name)
+                _, stream_length = await pipe.execute()
+                logging.debug("Stream length %s", stream_length)
+
     async def _maintenance_claim_pending_records(
         self,
         stop: asyncio.Event,
@@ -167,15 +270,20 @@ class RedisBroker(Broker):
             logging.debug("Claimed %s", claimed)
 
             _, messages, _ = claimed
-            for record_id, record in messages:
-                task = msgspec.json.decode(record[b"value"], type=TaskRecord)
-                task.requeue_count += 1
-                await self.enqueue(task)
-                await self._redis.xack(  # type: ignore[no-untyped-call]
+            if messages:
+                pipe = self._redis.pipeline(transaction=True)
+                for _, record in messages:
+                    task = _decoder.decode(record[b"value"])
+                    task.requeue_count += 1
+                    pipe.xadd(
+                        self._config.stream_name, {"value": _encoder.encode(task)}
+                    )
+                pipe.xack(
                     self._config.stream_name,
                     self._config.group_name,
-                    record_id,
+                    *(record_id for record_id, _ in messages),
                 )
+                await pipe.execute()
 
             sleep_task = asyncio.create_task(
                 asyncio.sleep(self._config.requeue_interval.total_seconds())
@@ -186,18 +294,60 @@ class RedisBroker(Broker):
             if stop.is_set():
                 return
 
+    async def _maintenance_ack_flusher(self, stop: asyncio.Event) -> None:
+        """ACK processed records in batches until stopped, then ACK them directly."""
+        max_batch = self._config.ack_max_batch
+        self._batch_acks = True
+        stop_task = asyncio.create_task(stop.wait())
+        try:
+            while True:
+                get_task = asyncio.create_task(self._ack_queue.get())
+                await asyncio.wait(
+                    {stop_task, get_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not get_task.done():
+                    get_task.cancel()
+                    break
+
+                record_ids = [get_task.result()]
+                if self._ack_queue.qsize() < max_batch - 1:
+                    await asyncio.sleep(self._config.ack_max_delay.total_seconds())
+                _drain_queue(self._ack_queue, record_ids, max_batch)
+                await self._ack(record_ids)
+        finally:
+            self._batch_acks = False
+        await self._flush_acks()
+
+    async def _flush_acks(self) -> None:
+        while not self._ack_queue.empty():
+            record_ids: list[bytes] = []
+            _drain_queue(self._ack_queue, record_ids, self._config.ack_max_batch)
+            await self._ack(record_ids)
+
+    async def _ack(self, record_ids: list[bytes]) -> None:
+        await self._redis.xack(  # type: ignore[no-untyped-call]
+            self._config.stream_name,
+            self._config.group_name,
+            *record_ids,
+        )
+        logging.info("Acked %s", record_ids)
+
+    def _forget_task(self, task_id: str) -> None:
+        self._task_ids.pop(task_id, None)
+        if not self._task_ids:
+            self._has_active_tasks.clear()
+
     @contextlib.asynccontextmanager
     async def ack_context(self, task: TaskRecord) -> AsyncIterator[None]:
         try:
             yield
         except Exception:
-            self._task_ids.pop(task.id, None)
+            self._forget_task(task.id)
             raise
         else:
-            record_id = self._task_ids.pop(task.id)
-            await self._redis.xack(  # type: ignore[no-untyped-call]
-                self._config.stream_name,
-                self._config.group_name,
-                record_id,
-            )
-            logging.info("Acked %s", task.id)
+            record_id = self._task_ids[task.id]
+            self._forget_task(task.id)
+            if self._batch_acks:
+                self._ack_queue.put_nowait(record_id)
+            else:
+                await self._ack([record_id])
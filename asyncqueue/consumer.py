@@ -1,7 +1,11 @@
 import asyncio
+import contextlib
+import signal
+from collections.abc import Iterator, Sequence
+from typing import Annotated
 
 import anyio.abc
-from anyio.streams.memory import MemoryObjectReceiveStream
+from typing_extensions import Doc
 
 from asyncqueue.broker.abc import Broker
 from asyncqueue.publisher import Configuration
@@ -9,9 +13,11 @@ from asyncqueue.result.abc import ResultBackend
 from asyncqueue.router import TaskRouter
 from asyncqueue.serialization import TaskRecord, deserialize_task
 
+_STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
 
 class AsyncWorker:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         broker: Broker,
         *,
@@ -19,34 +25,118 @@ class AsyncWorker:
         tasks: TaskRouter,
         configuration: Configuration,
         concurrency: int,
+        prefetch: Annotated[
+            int,
+            Doc(
+                "Amount of tasks received in addition to the running ones. "
+                "They are held (claimed) by this worker until a slot frees up, "
+                "so other workers can't take them and stop() waits for them too"
+            ),
+        ] = 0,
+        handle_signals: bool = False,
     ) -> None:
         self._broker = broker
         self._result_backend = result_backend
         self._tasks = tasks
         self._configuration = configuration
-        self._concurrency = concurrency
+        self._running = asyncio.Semaphore(concurrency)
+        self._in_flight = asyncio.Semaphore(concurrency + prefetch)
         self._tg = anyio.create_task_group()
         self._stop = asyncio.Event()
+        self._read_scope = anyio.CancelScope()
+        self._handle_signals = handle_signals
 
     async def run(self) -> None:
-        send, recv = anyio.create_memory_object_stream[TaskRecord]()
+        maintenance_stop = asyncio.Event()
+        with self._stop_on_signals():
+            async with self._broker, anyio.create_task_group() as tg:
+                tg.start_soon(
+                    self._broker.run_worker_maintenance_tasks, maintenance_stop
+                )
+                async with self._tg as tasks_tg:
+                    tasks_tg.start_soon(self._read_pump, tasks_tg)
+                # Records are kept claimed and ACKs are flushed until every
+                # received task is processed
+                maintenance_stop.set()
 
-        async with self._broker, self._tg as tg, send:
-            tg.start_soon(self._broker.run_worker_maintenance_tasks, self._stop)
+    @contextlib.contextmanager
+    def _stop_on_signals(self) -> Iterator[None]:
+        """
+        Stop the worker on SIGINT/SIGTERM, a second signal falls back to the default handler.
 
-            for _ in range(self._concurrency):
-                tg.start_soon(self._worker, recv.clone())
+        Replaces signal handlers installed by the application while the worker runs.
+        """
+        if not self._handle_signals:
+            yield
+            return
 
-            async for message in self._broker.listen():
-                await send.send(message)
+        loop = asyncio.get_running_loop()
+        try:
+            for sig in _STOP_SIGNALS:
+                loop.add_signal_handler(sig, self._on_signal, sig)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on windows or outside of the main thread
+            yield
+            return
 
-    async def _worker(self, recv: MemoryObjectReceiveStream[TaskRecord]) -> None:
-        async for task in recv:
-            async with self._broker.ack_context(task):
-                task_definition = self._tasks.tasks[task.task_name]
-                args, kwargs = deserialize_task(
-                    task, self._configuration.serialization_backends
-                )
-                result = await task_definition.func(*args, **kwargs)
-            if self._result_backend:
-                await self._result_backend.set(task_id=task.id, value=result)
+        try:
+            yield
+        finally:
+            for sig in _STOP_SIGNALS:
+                loop.remove_signal_handler(sig)
+
+    def _on_signal(self, sig: signal.Signals) -> None:
+        if not self._stop.is_set():
+            self.stop()
+            return
+
+        asyncio.get_running_loop().remove_signal_handler(sig)
+        signal.raise_signal(sig)
+
+    def stop(self) -> None:
+        """Stop reading new tasks, already received ones are still processed."""
+        self._stop.set()
+        self._read_scope.cancel()
+
+    async def _read_pump(self, tg: anyio.abc.TaskGroup) -> None:
+        ack_context = self._broker.ack_context
+        tasks = self._tasks.tasks
+        serialization_backends = self._configuration.serialization_backends
+        result_backend = self._result_backend
+        running = self._running
+        in_flight = self._in_flight
+
+        async def execute(task: TaskRecord) -> None:
+            try:
+                async with ack_context(task):
+                    task_definition = tasks[task.task_name]
+                    args, kwargs = deserialize_task(task, serialization_backends)
+                    async with running:
+                        result = await task_definition.func(*args, **kwargs)
+                if result_backend:
+                    await result_backend.set(task_id=task.id, value=result)
+            finally:
+                in_flight.release()
+
+        read = self._broker.read
+        while True:
+            # Slots are taken before reading, so received tasks are never dropped
+            await in_flight.acquire()
+            count = 1
+            while not in_flight.locked():
+                await in_flight.acquire()
+                count += 1
+            if self._stop.is_set():
+                for _ in range(count):
+                    in_flight.release()
+                return
+
+            messages: Sequence[TaskRecord] = ()
+            with self._read_scope:
+                messages = await read(count)
+            self._read_scope = anyio.CancelScope()
+
+            for _ in range(count - len(messages)):
+                in_flight.release()
+            for message in messages:
+                tg.start_soon(execute, message)
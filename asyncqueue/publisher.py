@@ -23,6 +23,9 @@ class Configuration:
                 (default_serialization_backend,),
             )
         }
+        self.serialization_backend_cache: dict[
+            type[object], SerializationBackend[Any]
+        ] = {}
 
 
 class Publisher:
@@ -35,6 +38,7 @@ class Publisher:
             task,
             default_backend=self._config.default_serialization_backend,
             serialization_backends=self._config.serialization_backends,
+            cache=self._config.serialization_backend_cache,
         )
         await self._broker.enqueue(record)
         return RunningTask(instance=task, id=record.id)
@@ -23,6 +23,7 @@ class RedisResultBackend(ResultBackend):
             value=value,
             default_backend=self._config.default_serialization_backend,
             backends=self._config.serialization_backends,
+            cache=self._config.serialization_backend_cache,
         )
         await self._redis.set(
             name=f"{task_id}-result", value=f"{backend_id},{serialized_value.decode()}"
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import dataclasses
-import uuid
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, MutableMapping
 from datetime import datetime
 from typing import Any, Generic, NewType
 
 import msgspec
 
 from asyncqueue._types import TResult
-from asyncqueue._util import utc_now
+from asyncqueue._util import utc_now, uuid7
 from asyncqueue.task import TaskInstance
 
 Deserializer = Callable[[bytes], TResult]
@@ -30,12 +29,26 @@ def serialize(
     value: object,
     default_backend: SerializationBackend[object],
     backends: Mapping[SerializationBackendId, SerializationBackend[object]],
+    cache: MutableMapping[type[object], SerializationBackend[object]] | None = None,
 ) -> tuple[SerializationBackendId, bytes]:
+    value_type = type(value)
+    backend = cache.get(value_type) if cache is not None else None
+    if backend is None:
+        backend = _find_backend(value, default_backend, backends)
+        if cache is not None:
+            cache[value_type] = backend
+    return backend.id, backend.serialize(value)
+
+
+def _find_backend(
+    value: object,
+    default_backend: SerializationBackend[object],
+    backends: Mapping[SerializationBackendId, SerializationBackend[object]],
+) -> SerializationBackend[object]:
     for backend in backends.values():
         if isinstance(value, backend.instance_of):
-            return backend.id, backend.serialize(value)
-
-    return default_backend.id, default_backend.serialize(value)
+            return backend
+    return default_backend
 
 
 class TaskRecord(msgspec.Struct, kw_only=True):
@@ -54,12 +67,14 @@ def serialize_task(
         SerializationBackendId,
         SerializationBackend[object],
     ],
+    cache: MutableMapping[type[object], SerializationBackend[object]] | None = None,
 ) -> TaskRecord:
     args = [
         serialize(
             value,
             default_backend=default_backend,
             backends=serialization_backends,
+            cache=cache,
         )
         for value in task.args
     ]
@@ -68,11 +83,12 @@ def serialize_task(
             value,
             default_backend=default_backend,
             backends=serialization_backends,
+            cache=cache,
         )
         for key, value in task.kwargs.items()
     }
     return TaskRecord(
-        id=str(uuid.uuid4()),
+        id=str(uuid7()),
         task_name=task.task.params.name,
         enqueue_time=utc_now(),
         args=args,
@@ -88,8 +104,10 @@ def deserialize_task(
     ],
 ) -> tuple[tuple[object, ...], dict[str, object]]:
     args = tuple(
-        serialization_backends[backend_id].deserialize(value)
-        for backend_id, value in task.args
+        [
+            serialization_backends[backend_id].deserialize(value)
+            for backend_id, value in task.args
+        ]
     )
     kwargs = {
         key: serialization_backends[backend_id].deserialize(value)
@@ -5,6 +5,6 @@ from ._serialization import SerializationBackend, SerializationBackendId
 MsgSpecSerializer = SerializationBackend(
     id=SerializationBackendId("msgspec"),
     instance_of=msgspec.Struct,
-    serialize=msgspec.json.encode,
-    deserialize=msgspec.json.decode,
+    serialize=msgspec.json.Encoder().encode,
+    deserialize=msgspec.json.Decoder().decode,
 )
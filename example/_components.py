@@ -1,7 +1,7 @@
 from redis.asyncio import Redis
 
 from asyncqueue.broker.abc import Broker
-from asyncqueue.broker.redis import RedisBroker, RedisBrokerConfig
+from asyncqueue.broker.redis import RedisBroker
 from asyncqueue.publisher import Configuration
 from asyncqueue.result.abc import ResultBackend
 from asyncqueue.result.redis import RedisResultBackend
@@ -20,9 +20,6 @@ def create_broker() -> Broker:
     return RedisBroker(
         redis=_redis(),
         consumer_name="asyncqueue",
-        config=RedisBrokerConfig(
-            xread_count=1,
-        ),
     )
 
 
@@ -14,6 +14,7 @@ async def main() -> None:
             configuration=configuration,
             tasks=router,
             concurrency=20,
+            handle_signals=True,
             result_backend=create_result_backend(),
         )
         await worker.run()
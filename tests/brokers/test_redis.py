@@ -0,0 +1,155 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import anyio
+import anyio.lowlevel
+import pytest
+from asyncqueue._util import utc_now
+from asyncqueue.broker.redis import RedisBroker, RedisBrokerConfig, RedisClient
+from asyncqueue.serialization import TaskRecord
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from tests.utils import SOME_MAGIC_WAIT_TIME
+
+
+def _task() -> TaskRecord:
+    return TaskRecord(
+        id=str(uuid.uuid4()),
+        enqueue_time=utc_now(),
+        task_name="some-name",
+        args=[],
+        kwargs={},
+    )
+
+
+@pytest.fixture
+def redis() -> RedisClient:
+    return FakeAsyncRedis(server=FakeServer())
+
+
+@pytest.fixture
+def config() -> RedisBrokerConfig:
+    return RedisBrokerConfig(
+        reclaim_time=timedelta(seconds=SOME_MAGIC_WAIT_TIME / 4),
+        requeue_interval=timedelta(seconds=SOME_MAGIC_WAIT_TIME),
+    )
+
+
+@pytest.fixture
+async def broker(
+    redis: RedisClient, config: RedisBrokerConfig
+) -> AsyncIterator[RedisBroker]:
+    async with RedisBroker(redis=redis, config=config, consumer_name="test") as broker:
+        yield broker
+
+
+async def _pending(redis: RedisClient, config: RedisBrokerConfig) -> int:
+    pending = await redis.xpending(config.stream_name, config.group_name)  # type: ignore[no-untyped-call]
+    return int(pending["pending"])
+
+
+@pytest.mark.usefixtures("broker")
+async def test_creates_group(
+    redis: RedisClient,
+    config: RedisBrokerConfig,
+) -> None:
+    async with RedisBroker(redis=redis, config=config, consumer_name="other"):
+        pass
+
+    groups = await redis.xinfo_groups(config.stream_name)  # type: ignore[no-untyped-call]
+    assert [group["name"] for group in groups] == [config.group_name.encode()]
+
+
+async def test_enqueue_read_ack(
+    redis: RedisClient,
+    config: RedisBrokerConfig,
+    broker: RedisBroker,
+) -> None:
+    task = _task()
+    await broker.enqueue(task)
+
+    assert await broker.read(10) == [task]
+    assert await _pending(redis, config) == 1
+
+    async with broker.ack_context(task):
+        pass
+    assert await _pending(redis, config) == 0
+
+
+async def test_read_count(
+    redis: RedisClient,
+    config: RedisBrokerConfig,
+    broker: RedisBroker,
+) -> None:
+    tasks = [_task() for _ in range(5)]
+    await asyncio.gather(*(broker.enqueue(task) for task in tasks))
+
+    assert await broker.read(2) == tasks[:2]
+    assert await _pending(redis, config) == 2  # noqa: PLR2004
+
+
+async def test_aexit_sends_buffered_tasks(
+    redis: RedisClient,
+    config: RedisBrokerConfig,
+) -> None:
+    count = 10
+    async with (
+        RedisBroker(redis=redis, config=config, consumer_name="test") as broker,
+        anyio.create_task_group() as tg,
+    ):
+        for _ in range(count):
+            tg.start_soon(broker.enqueue, _task())
+        await anyio.lowlevel.checkpoint()
+
+    assert await redis.xlen(config.stream_name) == count
+
+
+async def test_read_records_are_kept_claimed(
+    redis: RedisClient,
+    config: RedisBrokerConfig,
+    broker: RedisBroker,
+) -> None:
+    tasks = [_task() for _ in range(3)]
+    await asyncio.gather(*(broker.enqueue(task) for task in tasks))
+
+    stop = asyncio.Event()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(broker.run_worker_maintenance_tasks, stop)
+        # Every record of the batch is waiting longer than requeue_interval
+        read = await broker.read(len(tasks))
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME * 3)
+        for task in read:
+            async with broker.ack_context(task):
+                pass
+        stop.set()
+
+    assert await redis.xlen(config.stream_name) == len(tasks)
+    assert await _pending(redis, config) == 0
+
+
+async def test_requeue_pending_records(
+    redis: RedisClient,
+    config: RedisBrokerConfig,
+    broker: RedisBroker,
+) -> None:
+    task = _task()
+    await broker.enqueue(task)
+    await broker.read(1)
+
+    await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+    stop = asyncio.Event()
+    async with (
+        RedisBroker(redis=redis, config=config, consumer_name="other") as other,
+        anyio.create_task_group() as tg,
+    ):
+        tg.start_soon(other.run_worker_maintenance_tasks, stop)
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME / 2)
+        stop.set()
+
+        (requeued,) = await other.read(1)
+
+    assert requeued.id == task.id
+    assert requeued.requeue_count == 1
+    assert await redis.xlen(config.stream_name) == 2  # noqa: PLR2004
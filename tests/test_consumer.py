@@ -0,0 +1,264 @@
+import asyncio
+import os
+import signal
+
+import anyio
+import pytest
+from asyncqueue.broker.inmemory import InMemoryBroker
+from asyncqueue.consumer import AsyncWorker
+from asyncqueue.publisher import Configuration, Publisher
+from asyncqueue.router import TaskRouter
+from asyncqueue.serialization import SerializationBackend, SerializationBackendId
+from asyncqueue.task import TaskParams
+
+from tests.utils import SOME_MAGIC_WAIT_TIME
+
+
+async def test_worker_runs_tasks(
+    broker: InMemoryBroker,
+    publisher: Publisher,
+    configuration: Configuration,
+) -> None:
+    router = TaskRouter()
+    results: list[int] = []
+
+    @router.task(TaskParams(name="append"))
+    async def append(value: int) -> None:
+        results.append(value)
+
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=router,
+        configuration=configuration,
+        concurrency=2,
+    )
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker.run)
+        for i in range(5):
+            await publisher.enqueue(append(i))
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+        worker.stop()
+
+    assert sorted(results) == list(range(5))
+
+
+async def test_worker_concurrency(
+    broker: InMemoryBroker,
+    publisher: Publisher,
+    configuration: Configuration,
+) -> None:
+    router = TaskRouter()
+    concurrency = 3
+    running = 0
+    max_running = 0
+
+    @router.task(TaskParams(name="sleep"))
+    async def sleep() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME / 10)
+        running -= 1
+
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=router,
+        configuration=configuration,
+        concurrency=concurrency,
+    )
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker.run)
+        for _ in range(10):
+            await publisher.enqueue(sleep())
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+        worker.stop()
+
+    assert max_running == concurrency
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+async def test_worker_prefetch(
+    broker: InMemoryBroker,
+    configuration: Configuration,
+    prefetch: int,
+) -> None:
+    concurrency = 2
+    deserialized = 0
+    running = 0
+    release = asyncio.Event()
+
+    def deserialize(value: bytes) -> int:
+        nonlocal deserialized
+        deserialized += 1
+        return int(value)
+
+    configuration = Configuration(
+        default_serialization_backend=configuration.default_serialization_backend,
+        serialization_backends=[
+            SerializationBackend(
+                id=SerializationBackendId("int"),
+                instance_of=int,
+                serialize=lambda value: str(value).encode(),
+                deserialize=deserialize,
+            ),
+        ],
+    )
+    publisher = Publisher(broker=broker, config=configuration)
+    router = TaskRouter()
+
+    @router.task(TaskParams(name="wait"))
+    async def wait(value: int) -> None:  # noqa: ARG001
+        nonlocal running
+        running += 1
+        await release.wait()
+
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=router,
+        configuration=configuration,
+        concurrency=concurrency,
+        prefetch=prefetch,
+    )
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker.run)
+        for i in range(10):
+            await publisher.enqueue(wait(i))
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+
+        assert running == concurrency
+        assert deserialized == concurrency + prefetch
+
+        release.set()
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+        worker.stop()
+
+    assert running == deserialized == 10  # noqa: PLR2004
+
+
+async def test_worker_stop_does_not_drop_tasks(
+    broker: InMemoryBroker,
+    publisher: Publisher,
+    configuration: Configuration,
+) -> None:
+    router = TaskRouter()
+    results: list[int] = []
+
+    @router.task(TaskParams(name="append"))
+    async def append(value: int) -> None:
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME / 10)
+        results.append(value)
+
+    for i in range(4):
+        await publisher.enqueue(append(i))
+
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=router,
+        configuration=configuration,
+        concurrency=1,
+        prefetch=0,
+    )
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker.run)
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME / 20)
+        worker.stop()
+    assert results == [0]
+
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=router,
+        configuration=configuration,
+        concurrency=1,
+    )
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker.run)
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+        worker.stop()
+
+    assert results == [0, 1, 2, 3]
+
+
+async def test_worker_maintenance_runs_until_tasks_are_processed(
+    configuration: Configuration,
+) -> None:
+    maintenance_stopped_at: list[bool] = []
+    finished = False
+
+    class Broker(InMemoryBroker):
+        async def run_worker_maintenance_tasks(self, stop: asyncio.Event) -> None:
+            await stop.wait()
+            maintenance_stopped_at.append(finished)
+
+    router = TaskRouter()
+
+    @router.task(TaskParams(name="slow"))
+    async def slow() -> None:
+        nonlocal finished
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+        finished = True
+
+    broker = Broker(max_buffer_size=16)
+    publisher = Publisher(broker=broker, config=configuration)
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=router,
+        configuration=configuration,
+        concurrency=1,
+    )
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker.run)
+        await publisher.enqueue(slow())
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME / 10)
+        worker.stop()
+
+    assert maintenance_stopped_at == [True]
+
+
+async def test_worker_stop(
+    broker: InMemoryBroker, configuration: Configuration
+) -> None:
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=TaskRouter(),
+        configuration=configuration,
+        concurrency=2,
+    )
+    worker.stop()
+    with anyio.fail_after(1):
+        await worker.run()
+
+
+async def test_worker_stops_on_sigterm(
+    broker: InMemoryBroker,
+    configuration: Configuration,
+) -> None:
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=TaskRouter(),
+        configuration=configuration,
+        concurrency=2,
+        handle_signals=True,
+    )
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(worker.run)
+            await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+
+async def test_worker_does_not_handle_signals_by_default(
+    broker: InMemoryBroker,
+    configuration: Configuration,
+) -> None:
+    worker = AsyncWorker(
+        broker=broker,
+        tasks=TaskRouter(),
+        configuration=configuration,
+        concurrency=2,
+    )
+    handler = signal.getsignal(signal.SIGTERM)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker.run)
+        await asyncio.sleep(SOME_MAGIC_WAIT_TIME)
+        assert signal.getsignal(signal.SIGTERM) is handler
+        worker.stop()
@@ -0,0 +1,60 @@
+import msgspec
+from asyncqueue.publisher import Configuration
+from asyncqueue.serialization import (
+    SerializationBackend,
+    SerializationBackendId,
+    serialize,
+)
+from asyncqueue.serialization.msgspec import MsgSpecSerializer
+
+
+class Point(msgspec.Struct):
+    x: int
+    y: int
+
+
+StrSerializer = SerializationBackend(
+    id=SerializationBackendId("str"),
+    instance_of=str,
+    serialize=str.encode,
+    deserialize=bytes.decode,
+)
+
+
+def test_serialize_caches_backend_by_type() -> None:
+    configuration = Configuration(
+        default_serialization_backend=MsgSpecSerializer,
+        serialization_backends=[StrSerializer],
+    )
+    cache = configuration.serialization_backend_cache
+
+    for value in ("a", "b"):
+        assert serialize(
+            value,
+            default_backend=configuration.default_serialization_backend,
+            backends=configuration.serialization_backends,
+            cache=cache,
+        ) == (StrSerializer.id, value.encode())
+
+    serialize(
+        Point(x=1, y=2),
+        default_backend=configuration.default_serialization_backend,
+        backends=configuration.serialization_backends,
+        cache=cache,
+    )
+    assert cache == {str: StrSerializer, Point: MsgSpecSerializer}
+
+
+def test_serialize_uses_cached_backend() -> None:
+    configuration = Configuration(
+        default_serialization_backend=MsgSpecSerializer,
+        serialization_backends=[StrSerializer],
+    )
+    configuration.serialization_backend_cache[str] = MsgSpecSerializer
+
+    assert serialize(
+        "a",
+        default_backend=configuration.default_serialization_backend,
+        backends=configuration.serialization_backends,
+        cache=configuration.serialization_backend_cache,
+    ) == (MsgSpecSerializer.id, b'"a"')
@@ -0,0 +1,37 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from asyncqueue._util import uuid7
+from freezegun import freeze_time
+
+
+def test_uuid7() -> None:
+    value = uuid7()
+    assert value.version == 7  # noqa: PLR2004
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_is_time_ordered() -> None:
+    with freeze_time(datetime(2000, 1, 1, tzinfo=timezone.utc)) as frozen_time:
+        ids = []
+        for _ in range(10):
+            ids.append(str(uuid7()))
+            frozen_time.tick(timedelta(seconds=1))
+
+    assert ids == sorted(ids)
+
+
+def test_uuid7_is_ordered_within_millisecond() -> None:
+    with freeze_time(datetime(2000, 1, 1, tzinfo=timezone.utc)):
+        ids = [str(uuid7()) for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_uuid7_is_unique_across_threads() -> None:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ids = list(executor.map(lambda _: uuid7(), range(10_000)))
+
+    assert len(set(ids)) == len(ids)
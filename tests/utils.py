@@ -18,16 +18,15 @@ async def capture_broker_messages(
     should_stop = asyncio.Event()
 
     async def capture() -> None:
-        iterator = broker.listen()
         stop_task = asyncio.create_task(should_stop.wait())
         while True:
-            next_coro = asyncio.create_task(anext(iterator))  # type: ignore[var-annotated, arg-type]
+            read_task = asyncio.create_task(broker.read(1))
             await asyncio.wait(
-                [next_coro, stop_task],
+                [read_task, stop_task],
                 return_when=asyncio.FIRST_COMPLETED,
             )
-            if next_coro.done():
-                messages.append(next_coro.result())
+            if read_task.done():
+                messages.extend(read_task.result())
 
             if should_stop.is_set():
                 return